@@ -5,12 +5,30 @@ Eliminates manual intervention and repetition in environment creation
 """
 
 import argparse
+import copy
 import os
 import sys
 from pathlib import Path
 import yaml
 import shutil
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+@lru_cache(maxsize=8)
+def _read_yaml(path_str, mtime_ns):
+    """Parse a YAML file once per (path, mtime) pair"""
+    with open(path_str, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+def _load_yaml(path):
+    """Load a YAML file through the mtime-keyed cache"""
+    # Hand out a copy so callers mutating the result cannot corrupt the cache
+    return copy.deepcopy(_read_yaml(str(path), path.stat().st_mtime_ns))
 
 def load_defaults():
     """Load default configurations"""
@@ -21,14 +39,12 @@ def load_defaults():
     # Load service defaults
     service_defaults_path = inventory_dir / "group_vars" / "defaults" / "service_defaults.yml"
     if service_defaults_path.exists():
-        with open(service_defaults_path, 'r') as f:
-            defaults.update(yaml.safe_load(f))
+        defaults.update(_load_yaml(service_defaults_path))
     
     # Load environment configs
     env_configs_path = inventory_dir / "group_vars" / "defaults" / "environment_configs.yml"
     if env_configs_path.exists():
-        with open(env_configs_path, 'r') as f:
-            defaults.update(yaml.safe_load(f))
+        defaults.update(_load_yaml(env_configs_path))
     
     return defaults
 
@@ -117,9 +133,9 @@ def write_environment_file(config, output_path):
 #
 """
     
-    with open(output_path, 'w') as f:
-        f.write(header)
-        yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Serialize in memory and emit header + body with a single write
+    body = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    output_path.write_text(header + body, encoding='utf-8')
 
 def main():
     parser = argparse.ArgumentParser(description='Generate oaAnsible environment inventory')
@@ -147,7 +163,7 @@ def main():
     )
     
     if args.dry_run:
-        print(yaml.dump(config, default_flow_style=False, allow_unicode=True, sort_keys=False))
+        print(yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False))
         return
     
     # Determine output path
@@ -162,7 +178,7 @@ def main():
     print(f"Generated environment: {output_path}")
     
     # Show reduced size
-    original_size = sum(len(yaml.dump(config, default_flow_style=False)) for _ in [1])  # Estimate
+    original_size = sum(len(yaml.dump(config, Dumper=SafeDumper, default_flow_style=False)) for _ in [1])  # Estimate
     print(f"Configuration references centralized defaults - significant size reduction achieved")
 
 if __name__ == '__main__':
@@ -5,6 +5,7 @@ Provides REST endpoints for remote Ansible deployment management
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import uuid
@@ -13,10 +14,13 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
-import uvicorn
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
 
 from jobs.job_manager import JobManager, JobStatus
 from auth.auth_manager import AuthManager
@@ -27,11 +31,20 @@ from config.server_config import ServerConfig
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+API_VERSION = "1.0.0"
+
+# Process-lifetime values reported by /api/health, built once at import
+HEALTH_COMPONENTS = {
+    "job_manager": "ready",
+    "ansible_executor": "ready",
+    "auth_manager": "ready"
+}
+
 # Initialize FastAPI app
 app = FastAPI(
     title="oaAnsible Server API",
     description="Remote Ansible deployment management for oaDashboard",
-    version="1.0.0",
+    version=API_VERSION,
     docs_url="/api/docs",
     redoc_url="/api/redoc"
 )
@@ -43,7 +56,32 @@ security = HTTPBearer()
 config = ServerConfig()
 job_manager = JobManager()
 auth_manager = AuthManager()
-ansible_executor = AnsibleExecutor(str(config.ansible_root))
+ansible_executor = AnsibleExecutor(str(config.ansible_root), job_manager=job_manager)
+
+# Bounds concurrent ansible-playbook runs; extra jobs stay queued until a slot frees
+deployment_semaphore = asyncio.Semaphore(config.max_concurrent_jobs)
+
+def rate_limit_key(request: Request) -> str:
+    """Rate-limit per caller token; fall back to the client address"""
+    # The dashboard backend proxies many users from one IP, so key on identity
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        return "token:" + hashlib.sha256(token.encode()).hexdigest()
+    return get_remote_address(request)
+
+# Per-caller rate limiting for expensive endpoints (answers 429 with Retry-After)
+limiter = Limiter(key_func=rate_limit_key, headers_enabled=True)
+app.state.limiter = limiter
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    """Answer 429 in the API's usual {"detail": ...} shape, with Retry-After"""
+    response = JSONResponse(
+        status_code=429,
+        content={"detail": f"Rate limit exceeded: {exc.detail}"}
+    )
+    return request.app.state.limiter._inject_headers(response, request.state.view_rate_limit)
+DEPLOY_RATE_LIMIT = f"{config.rate_limit_requests} per {config.rate_limit_window_minutes} minutes"
 
 # Pydantic Models
 class ComponentRequest(BaseModel):
@@ -97,38 +135,37 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         timestamp=datetime.now(timezone.utc),
-        version="1.0.0",
-        components={
-            "job_manager": "ready",
-            "ansible_executor": "ready",
-            "auth_manager": "ready"
-        }
+        version=API_VERSION,
+        components=HEALTH_COMPONENTS
     )
 
 @app.post("/api/deploy/components", response_model=JobResponse)
+@limiter.limit(DEPLOY_RATE_LIMIT)
 async def deploy_components(
-    request: ComponentRequest,
+    request: Request,
+    response: Response,
+    deploy_request: ComponentRequest,
     background_tasks: BackgroundTasks,
     user: dict = Depends(get_current_user)
 ):
     """Deploy selected components to target environment"""
     try:
         # Validate request
-        if not request.components:
+        if not deploy_request.components:
             raise HTTPException(status_code=400, detail="No components specified")
         
-        if request.environment not in ["staging", "production", "preprod"]:
+        if deploy_request.environment not in ["staging", "production", "preprod"]:
             raise HTTPException(status_code=400, detail="Invalid environment")
         
         # Create deployment job
         job_id = str(uuid.uuid4())
         job_data = {
             "type": "component_deployment",
-            "environment": request.environment,
-            "components": request.components,
-            "target_hosts": request.target_hosts,
-            "execution_mode": request.execution_mode,
-            "options": request.options,
+            "environment": deploy_request.environment,
+            "components": deploy_request.components,
+            "target_hosts": deploy_request.target_hosts,
+            "execution_mode": deploy_request.execution_mode,
+            "options": deploy_request.options,
             "user": user["username"],
             "user_id": user["id"]
         }
@@ -152,9 +189,9 @@ async def deploy_components(
             created_at=job.created_at,
             updated_at=job.updated_at,
             details={
-                "environment": request.environment,
-                "components": request.components,
-                "execution_mode": request.execution_mode
+                "environment": deploy_request.environment,
+                "components": deploy_request.components,
+                "execution_mode": deploy_request.execution_mode
             }
         )
         
@@ -299,7 +336,18 @@ async def list_components(user: dict = Depends(get_current_user)):
 
 # Background task functions
 async def execute_deployment_job(job_id: str, job_data: Dict[str, Any]):
-    """Execute deployment job in background"""
+    """Execute deployment job in background once a concurrency slot is free"""
+    async with deployment_semaphore:
+        # Skip jobs cancelled while waiting for a slot
+        job = await job_manager.get_job(job_id)
+        if job and job.status == JobStatus.CANCELLED:
+            logger.info(f"Skipping cancelled deployment job {job_id}")
+            return
+        
+        await _run_deployment_job(job_id, job_data)
+
+async def _run_deployment_job(job_id: str, job_data: Dict[str, Any]):
+    """Run the deployment and record its outcome on the job"""
     try:
         await job_manager.update_job_status(job_id, JobStatus.RUNNING, "Starting deployment...")
         
@@ -341,9 +389,12 @@ async def execute_deployment_job(job_id: str, job_data: Dict[str, Any]):
 async def startup():
     """Initialize server components"""
     logger.info("Starting oaAnsible Server API...")
-    await job_manager.initialize()
-    await auth_manager.initialize()
-    await ansible_executor.initialize()
+    # The dashboard HTTP probe and the `ansible --version` subprocess overlap;
+    # the sqlite setup is blocking and simply runs first. A failure cancels the rest.
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(job_manager.initialize())
+        tg.create_task(auth_manager.initialize())
+        tg.create_task(ansible_executor.initialize())
     logger.info("oaAnsible Server API started successfully")
 
 @app.on_event("shutdown")
@@ -356,6 +407,8 @@ async def shutdown():
     logger.info("oaAnsible Server API shutdown complete")
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "deployment_api:app",
         host=config.api_host,
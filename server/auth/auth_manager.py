@@ -30,6 +30,25 @@ class AuthManager:
         # In-memory token cache (in production, use Redis)
         self._token_cache: Dict[str, Dict[str, Any]] = {}
         self._cache_lock = asyncio.Lock()
+        
+        # In-flight validations by token, shared by concurrent callers
+        self._pending_validations: Dict[str, asyncio.Future] = {}
+        
+        # Shared HTTP client so dashboard calls reuse pooled keep-alive connections
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0, connect=5.0, pool=2.0),
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=30.0
+                )
+            )
+        return self._http_client
     
     async def initialize(self):
         """Initialize the authentication manager"""
@@ -47,18 +66,22 @@ class AuthManager:
         """Cleanup resources"""
         async with self._cache_lock:
             self._token_cache.clear()
+        
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
         logger.info("Authentication manager cleanup complete")
     
     async def _test_dashboard_connection(self):
         """Test connection to oaDashboard API"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.dashboard_api_url}/api/health",
-                    headers={"Authorization": f"Bearer {self.dashboard_api_key}"}
-                )
-                response.raise_for_status()
-                logger.info("Successfully connected to oaDashboard API")
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.dashboard_api_url}/api/health",
+                headers={"Authorization": f"Bearer {self.dashboard_api_key}"}
+            )
+            response.raise_for_status()
+            logger.info("Successfully connected to oaDashboard API")
         except Exception as e:
             logger.warning(f"Could not connect to oaDashboard API: {e}")
     
@@ -75,46 +98,59 @@ class AuthManager:
                         # Remove expired token
                         del self._token_cache[token]
             
-            # Try dashboard API validation first
-            user = await self._validate_with_dashboard(token)
-            if user:
-                await self._cache_user(token, user)
-                return user
-            
-            # Fall back to local JWT validation
-            user = await self._validate_jwt_token(token)
-            if user:
-                await self._cache_user(token, user)
-                return user
+            # Coalesce concurrent validations of the same token into one lookup
+            pending = self._pending_validations.get(token)
+            if pending is None:
+                pending = asyncio.ensure_future(self._validate_uncached(token))
+                self._pending_validations[token] = pending
+                pending.add_done_callback(
+                    lambda _: self._pending_validations.pop(token, None)
+                )
             
-            return None
+            return await asyncio.shield(pending)
             
         except Exception as e:
             logger.error(f"Token validation error: {e}")
             return None
     
+    async def _validate_uncached(self, token: str) -> Optional[Dict[str, Any]]:
+        """Validate a token that is not in the cache"""
+        # Try dashboard API validation first
+        user = await self._validate_with_dashboard(token)
+        if user:
+            await self._cache_user(token, user)
+            return user
+        
+        # Fall back to local JWT validation
+        user = await self._validate_jwt_token(token)
+        if user:
+            await self._cache_user(token, user)
+            return user
+        
+        return None
+    
     async def _validate_with_dashboard(self, token: str) -> Optional[Dict[str, Any]]:
         """Validate token with oaDashboard API"""
         if not self.dashboard_api_url:
             return None
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.dashboard_api_url}/api/auth/validate",
-                    headers={"Authorization": f"Bearer {token}"}
-                )
-                
-                if response.status_code == 200:
-                    user_data = response.json()
-                    return {
-                        "id": user_data.get("id"),
-                        "username": user_data.get("username"),
-                        "email": user_data.get("email"),
-                        "is_admin": user_data.get("is_admin", False),
-                        "permissions": user_data.get("permissions", []),
-                        "source": "dashboard"
-                    }
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.dashboard_api_url}/api/auth/validate",
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            
+            if response.status_code == 200:
+                user_data = response.json()
+                return {
+                    "id": user_data.get("id"),
+                    "username": user_data.get("username"),
+                    "email": user_data.get("email"),
+                    "is_admin": user_data.get("is_admin", False),
+                    "permissions": user_data.get("permissions", []),
+                    "source": "dashboard"
+                }
         except Exception as e:
             logger.debug(f"Dashboard token validation failed: {e}")
         
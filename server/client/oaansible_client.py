@@ -7,6 +7,9 @@ For integration with oaDashboard and other services
 import asyncio
 import json
 import logging
+import random
+import threading
+import weakref
 from datetime import datetime
 from typing import Dict, List, Optional, Any, AsyncIterator
 import httpx
@@ -20,6 +23,14 @@ class OAAnsibleClientError(Exception):
 class OAAnsibleClient:
     """Async client for oaAnsible server API"""
     
+    # Retry policy for transient failures on GET requests
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.1
+    RETRY_MAX_DELAY = 1.0
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    # Connect-phase failures only; a read timeout already spent the full timeout
+    RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+    
     def __init__(
         self,
         base_url: str = "http://localhost:8001",
@@ -63,25 +74,41 @@ class OAAnsibleClient:
         if not self._client:
             raise OAAnsibleClientError("Client not connected. Use async context manager or call connect()")
     
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given (0-based) attempt"""
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+    
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request and handle errors"""
         self._ensure_client()
         
-        try:
-            response = await self._client.request(method, endpoint, **kwargs)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = "Unknown error"
+        # Only idempotent reads are retried; a deployment must never be submitted twice
+        attempts = self.RETRY_ATTEMPTS if method.upper() == "GET" else 1
+        
+        for attempt in range(attempts):
+            is_last_attempt = attempt == attempts - 1
             try:
-                error_data = e.response.json()
-                error_detail = error_data.get("detail", str(e))
-            except:
-                error_detail = str(e)
-            
-            raise OAAnsibleClientError(f"HTTP {e.response.status_code}: {error_detail}")
-        except httpx.RequestError as e:
-            raise OAAnsibleClientError(f"Request failed: {str(e)}")
+                response = await self._client.request(method, endpoint, **kwargs)
+                if response.status_code in self.RETRY_STATUS_CODES and not is_last_attempt:
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                error_detail = "Unknown error"
+                try:
+                    error_data = e.response.json()
+                    error_detail = error_data.get("detail", str(e))
+                except:
+                    error_detail = str(e)
+                
+                raise OAAnsibleClientError(f"HTTP {e.response.status_code}: {error_detail}")
+            except httpx.RequestError as e:
+                if isinstance(e, self.RETRY_EXCEPTIONS) and not is_last_attempt:
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                raise OAAnsibleClientError(f"Request failed: {str(e)}")
     
     # Health and Status
     async def health_check(self) -> Dict[str, Any]:
@@ -313,6 +340,22 @@ def create_sync_client(
     """Create synchronous client wrapper"""
     return SyncOAAnsibleClient(base_url, api_token, timeout)
 
+# Background event loop shared by every sync client, started on first use
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared sync-client event loop, starting its thread on first use"""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="oaansible-client", daemon=True
+            ).start()
+            _sync_loop = loop
+        return _sync_loop
+
 class SyncOAAnsibleClient:
     """Synchronous wrapper for oaAnsible client"""
     
@@ -320,22 +363,54 @@ class SyncOAAnsibleClient:
         self.base_url = base_url
         self.api_token = api_token
         self.timeout = timeout
+        # The async client lives on the shared loop. It is kept in a holder so the
+        # finalizer can close it without keeping the wrapper alive.
+        self._state: Dict[str, Optional[OAAnsibleClient]] = {"client": None}
+        self._finalizer = weakref.finalize(self, self._release_client, self._state)
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+    
+    @staticmethod
+    def _release_client(state: Dict[str, Optional[OAAnsibleClient]]):
+        """Schedule the held async client to close on the shared loop"""
+        client, state["client"] = state["client"], None
+        if client is None:
+            return None
+        return asyncio.run_coroutine_threadsafe(client.close(), _get_sync_loop())
     
     def _run_async(self, coro):
-        """Run async coroutine in sync context"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(coro)
+        """Run async coroutine on the shared loop and wait for the result"""
+        return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
+    
+    async def _get_client(self) -> OAAnsibleClient:
+        """Get this wrapper's async client, connecting it on first use"""
+        # Only ever runs on the shared loop, so no cross-thread locking is needed
+        client = self._state["client"]
+        if client is None:
+            client = OAAnsibleClient(self.base_url, self.api_token, self.timeout)
+            await client.connect()
+            self._state["client"] = client
+        return client
+    
+    def close(self):
+        """Close the HTTP connection pool"""
+        pending = self._finalizer()
+        if pending is not None:
+            pending.result()
+        # Stay usable after close(); a later call opens a fresh pool
+        self._finalizer = weakref.finalize(self, self._release_client, self._state)
     
     def health_check(self) -> Dict[str, Any]:
         """Sync health check"""
         async def _health():
-            async with OAAnsibleClient(self.base_url, self.api_token, self.timeout) as client:
-                return await client.health_check()
+            client = await self._get_client()
+            return await client.health_check()
         
         return self._run_async(_health())
     
@@ -347,15 +422,15 @@ class SyncOAAnsibleClient:
     ) -> Dict[str, Any]:
         """Sync component deployment"""
         async def _deploy():
-            async with OAAnsibleClient(self.base_url, self.api_token, self.timeout) as client:
-                return await client.deploy_components(environment, components, **kwargs)
+            client = await self._get_client()
+            return await client.deploy_components(environment, components, **kwargs)
         
         return self._run_async(_deploy())
     
     def get_job(self, job_id: str) -> Dict[str, Any]:
         """Sync get job"""
         async def _get_job():
-            async with OAAnsibleClient(self.base_url, self.api_token, self.timeout) as client:
-                return await client.get_job(job_id)
+            client = await self._get_client()
+            return await client.get_job(job_id)
         
         return self._run_async(_get_job())
\ No newline at end of file
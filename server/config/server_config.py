@@ -103,6 +103,10 @@ class ServerConfig:
         elif not (self.ansible_root / "inventory").exists():
             errors.append(f"Inventory directory not found in: {self.ansible_root}")
         
+        # Deployments wait on a semaphore of this size; 0 would queue jobs forever
+        if self.max_concurrent_jobs < 1:
+            errors.append(f"OAANSIBLE_MAX_CONCURRENT_JOBS must be at least 1, got {self.max_concurrent_jobs}")
+        
         # Check dashboard integration
         if not self.dashboard_api_key and not self.testing_mode:
             warnings.append("No dashboard API key configured - dashboard integration disabled")
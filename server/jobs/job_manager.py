@@ -25,7 +25,7 @@ class JobStatus(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job data structure"""
     job_id: str
@@ -44,6 +44,17 @@ class Job:
 class JobManager:
     """Manages deployment jobs with persistence and tracking"""
     
+    # Job columns with the job_logs lines folded back into a JSON array
+    JOB_SELECT = """
+        SELECT job_id, status, created_at, updated_at, data, message, result,
+               (SELECT json_group_array(line) FROM (
+                    SELECT line FROM job_logs
+                    WHERE job_logs.job_id = jobs.job_id
+                    ORDER BY seq
+               )) AS logs
+        FROM jobs
+    """
+    
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or "/tmp/oaansible_jobs.db"
         self.db_path = Path(self.db_path)
@@ -88,6 +99,28 @@ class JobManager:
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at)
             """)
+            # One row per log line, so appending never rewrites earlier output
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_logs (
+                    seq INTEGER PRIMARY KEY,
+                    job_id TEXT NOT NULL,
+                    line TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_job_logs_job_id ON job_logs(job_id, seq)
+            """)
+            # Move logs kept inline by older versions into job_logs
+            conn.execute("""
+                INSERT INTO job_logs (job_id, line)
+                SELECT jobs.job_id, entry.value
+                FROM jobs, json_each(jobs.logs) AS entry
+                WHERE jobs.logs IS NOT NULL AND jobs.logs != '[]'
+                ORDER BY jobs.job_id, entry.key
+            """)
+            conn.execute("""
+                UPDATE jobs SET logs = '[]' WHERE logs IS NOT NULL AND logs != '[]'
+            """)
             conn.commit()
     
     async def _load_jobs_cache(self):
@@ -95,8 +128,7 @@ class JobManager:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
-                cursor = conn.execute("""
-                    SELECT * FROM jobs 
+                cursor = conn.execute(self.JOB_SELECT + """
                     WHERE created_at > datetime('now', '-24 hours')
                     ORDER BY created_at DESC
                     LIMIT 1000
@@ -179,7 +211,7 @@ class JobManager:
         # Check database
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+            cursor = conn.execute(self.JOB_SELECT + " WHERE job_id = ?", (job_id,))
             row = cursor.fetchone()
             
             if row:
@@ -236,19 +268,22 @@ class JobManager:
             logger.error(f"Cannot add log to non-existent job {job_id}")
             return
         
-        timestamp = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
         log_with_timestamp = f"[{timestamp}] {log_entry}"
         job.logs.append(log_with_timestamp)
-        job.updated_at = datetime.now(timezone.utc)
+        job.updated_at = now
         
-        # Update database
-        row_data = self._job_to_row(job)
+        # Insert a row per line; the jobs row itself stays a fixed size
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                UPDATE jobs 
-                SET logs = ?, updated_at = ?
-                WHERE job_id = ?
-            """, (row_data["logs"], row_data["updated_at"], job_id))
+            conn.execute(
+                "INSERT INTO job_logs (job_id, line) VALUES (?, ?)",
+                (job_id, log_with_timestamp)
+            )
+            conn.execute(
+                "UPDATE jobs SET updated_at = ? WHERE job_id = ?",
+                (timestamp, job_id)
+            )
             conn.commit()
         
         # Update cache
@@ -293,8 +328,8 @@ class JobManager:
             
             # Get jobs
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute(f"""
-                SELECT * FROM jobs {where_clause}
+            cursor = conn.execute(self.JOB_SELECT + f"""
+                {where_clause}
                 ORDER BY created_at DESC
                 LIMIT ? OFFSET ?
             """, params + [page_size, offset])
@@ -331,6 +366,9 @@ class JobManager:
                 """.format(days_old))
                 
                 deleted_count = cursor.rowcount
+                conn.execute("""
+                    DELETE FROM job_logs WHERE job_id NOT IN (SELECT job_id FROM jobs)
+                """)
                 conn.commit()
                 
             # Clear relevant entries from cache
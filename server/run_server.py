@@ -16,7 +16,7 @@ server_dir = Path(__file__).parent
 sys.path.insert(0, str(server_dir))
 
 import uvicorn
-from api.deployment_api import app
+from api.deployment_api import app, config as server_config
 from config.server_config import ServerConfig
 
 # Configure logging
@@ -46,8 +46,8 @@ def handle_shutdown(signum, frame):
 
 async def run_server():
     """Run the server with proper startup and shutdown"""
-    # Load configuration
-    config = ServerConfig()
+    # Reuse the configuration the API module already loaded
+    config = server_config
     logger = setup_logging(config)
     
     try:
@@ -109,8 +109,8 @@ def main():
     """Main entry point"""
     try:
         # Check Python version
-        if sys.version_info < (3, 8):
-            print("ERROR: Python 3.8 or higher is required")
+        if sys.version_info < (3, 12):
+            print("ERROR: Python 3.12 or higher is required")
             sys.exit(1)
         
         # Check if we're in the right directory
@@ -119,8 +119,16 @@ def main():
             print("Current directory:", os.getcwd())
             sys.exit(1)
         
+        # Use uvloop when available (shipped with uvicorn[standard]); uvicorn's
+        # own loop selection is skipped because we serve inside asyncio.run()
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            loop_factory = None
+
         # Run the server
-        asyncio.run(run_server())
+        asyncio.run(run_server(), loop_factory=loop_factory)
         
     except KeyboardInterrupt:
         print("\nServer stopped by user")
@@ -0,0 +1,9 @@
+"""
+Pytest configuration for oaAnsible server tests
+"""
+
+import sys
+from pathlib import Path
+
+# Server modules import each other as top-level packages (see run_server.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,62 @@
+"""
+Tests for the authentication manager
+"""
+
+import asyncio
+
+import pytest
+
+from auth.auth_manager import AuthManager
+
+USER = {"id": "user-1", "username": "deployer"}
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    """Auth manager whose dashboard lookup blocks until released, counting calls"""
+    manager = AuthManager()
+    calls = []
+    release = asyncio.Event()
+
+    async def validate_with_dashboard(token):
+        calls.append(token)
+        await release.wait()
+        return USER
+
+    monkeypatch.setattr(manager, "_validate_with_dashboard", validate_with_dashboard)
+    return manager, calls, release
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_concurrent_validations_share_one_lookup(dashboard):
+    """N concurrent validations of an uncached token hit the dashboard once"""
+    manager, calls, release = dashboard
+
+    waiters = [asyncio.create_task(manager.validate_token("token")) for _ in range(10)]
+    await _settle()
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == ["token"]
+    assert results == [USER] * 10
+    assert manager._pending_validations == {}
+
+
+async def test_cancelling_one_waiter_keeps_the_others(dashboard):
+    """A cancelled caller does not cancel the shared lookup for everyone else"""
+    manager, calls, release = dashboard
+
+    waiters = [asyncio.create_task(manager.validate_token("token")) for _ in range(3)]
+    await _settle()
+    waiters[0].cancel()
+    await _settle()
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiters[0]
+    assert await asyncio.gather(*waiters[1:]) == [USER, USER]
+    assert calls == ["token"]
@@ -0,0 +1,123 @@
+"""
+Tests for the deployment API
+"""
+
+import asyncio
+import os
+
+# Keep the deploy rate limit small enough to exhaust in a test
+os.environ.setdefault("OAANSIBLE_RATE_LIMIT_REQUESTS", "3")
+os.environ.setdefault("OAANSIBLE_TESTING", "true")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import deployment_api
+from jobs.job_manager import JobManager, JobStatus
+
+DEPLOY_BODY = {"environment": "staging", "components": ["macos-api"]}
+
+
+@pytest.fixture
+def authorized_tokens(monkeypatch):
+    """Tokens the stubbed auth manager accepts; tests add to it as needed"""
+    tokens = set()
+
+    async def validate_token(token):
+        if token in tokens:
+            return {"id": token, "username": token}
+        return None
+
+    monkeypatch.setattr(deployment_api.auth_manager, "validate_token", validate_token)
+    return tokens
+
+
+@pytest.fixture
+def job_manager(tmp_path, monkeypatch):
+    """A job manager on a throwaway database, swapped in for the API's"""
+    manager = JobManager(str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(deployment_api, "job_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def client(job_manager, monkeypatch, authorized_tokens):
+    """Test client without lifespan; background deployments are stubbed out"""
+    asyncio.run(job_manager.initialize())
+
+    async def execute_deployment_job(job_id, job_data):
+        pass
+
+    monkeypatch.setattr(deployment_api, "execute_deployment_job", execute_deployment_job)
+    deployment_api.limiter.reset()
+    return TestClient(deployment_api.app)
+
+
+def _deploy(client, token):
+    return client.post(
+        "/api/deploy/components",
+        json=DEPLOY_BODY,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+def test_deploy_rate_limit_per_token(client, authorized_tokens):
+    """A token gets its own budget and then a 429 with detail and Retry-After"""
+    authorized_tokens.update({"token-a", "token-b"})
+    limit = deployment_api.config.rate_limit_requests
+
+    for _ in range(limit):
+        assert _deploy(client, "token-a").status_code == 200
+
+    limited = _deploy(client, "token-a")
+    assert limited.status_code == 429
+    assert "Rate limit exceeded" in limited.json()["detail"]
+    assert "Retry-After" in limited.headers
+
+    # A second caller behind the same address is not affected
+    assert _deploy(client, "token-b").status_code == 200
+
+
+def test_deploy_rate_limit_checked_after_auth(client, authorized_tokens):
+    """Rejected requests are answered 401 and do not use up the budget"""
+    limit = deployment_api.config.rate_limit_requests
+
+    for _ in range(limit + 2):
+        assert _deploy(client, "token-a").status_code == 401
+
+    authorized_tokens.add("token-a")
+    for _ in range(limit):
+        assert _deploy(client, "token-a").status_code == 200
+    assert _deploy(client, "token-a").status_code == 429
+
+
+async def test_queued_job_waits_and_cancelled_job_is_skipped(job_manager, monkeypatch):
+    """Jobs past the concurrency limit wait; one cancelled while waiting never runs"""
+    await job_manager.initialize()
+    for job_id in ("job-1", "job-2", "job-3"):
+        await job_manager.create_job(job_id, {})
+
+    started = []
+    release = asyncio.Event()
+
+    async def run_deployment_job(job_id, job_data):
+        started.append(job_id)
+        await release.wait()
+
+    monkeypatch.setattr(deployment_api, "_run_deployment_job", run_deployment_job)
+    monkeypatch.setattr(deployment_api, "deployment_semaphore", asyncio.Semaphore(1))
+
+    tasks = [
+        asyncio.create_task(deployment_api.execute_deployment_job(job_id, {}))
+        for job_id in ("job-1", "job-2", "job-3")
+    ]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert started == ["job-1"]
+
+    assert await job_manager.cancel_job("job-3")
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert started == ["job-1", "job-2"]
+    assert (await job_manager.get_job("job-3")).status == JobStatus.CANCELLED
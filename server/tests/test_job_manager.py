@@ -0,0 +1,74 @@
+"""
+Tests for the job manager
+"""
+
+import json
+import sqlite3
+
+from jobs.job_manager import JobManager
+
+
+async def test_job_logs_round_trip(tmp_path):
+    """Appended log lines come back in order from a fresh manager"""
+    db_path = tmp_path / "jobs.db"
+    manager = JobManager(str(db_path))
+    await manager.initialize()
+    await manager.create_job("job-1", {"environment": "staging"})
+
+    for line in ["PLAY [all]", "TASK [ping]", "ok: [host1]"]:
+        await manager.add_job_log("job-1", line)
+
+    reloaded = JobManager(str(db_path))
+    await reloaded.initialize()
+    reloaded._jobs_cache.clear()
+    job = await reloaded.get_job("job-1")
+
+    assert [entry.split("] ", 1)[1] for entry in job.logs] == [
+        "PLAY [all]", "TASK [ping]", "ok: [host1]"
+    ]
+    assert job.logs == await manager.get_job_logs("job-1")
+
+
+async def test_inline_logs_are_migrated(tmp_path):
+    """Logs stored in jobs.logs by older versions move into job_logs"""
+    db_path = tmp_path / "jobs.db"
+    manager = JobManager(str(db_path))
+    await manager.initialize()
+    await manager.create_job("job-1", {})
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE jobs SET logs = ? WHERE job_id = ?",
+            (json.dumps(["first", "second"]), "job-1")
+        )
+        conn.commit()
+
+    reloaded = JobManager(str(db_path))
+    await reloaded.initialize()
+    await reloaded.add_job_log("job-1", "third")
+    reloaded._jobs_cache.clear()
+    job = await reloaded.get_job("job-1")
+
+    assert job.logs[:2] == ["first", "second"]
+    assert job.logs[2].endswith("] third")
+
+    with sqlite3.connect(db_path) as conn:
+        stored = conn.execute("SELECT logs FROM jobs WHERE job_id = 'job-1'").fetchone()[0]
+    assert stored == "[]"
+
+
+async def test_add_job_log_leaves_jobs_row_untouched(tmp_path):
+    """Appending a line inserts into job_logs instead of growing jobs.logs"""
+    db_path = tmp_path / "jobs.db"
+    manager = JobManager(str(db_path))
+    await manager.initialize()
+    await manager.create_job("job-1", {})
+
+    for i in range(50):
+        await manager.add_job_log("job-1", f"line {i}")
+
+    with sqlite3.connect(db_path) as conn:
+        inline = conn.execute("SELECT logs FROM jobs WHERE job_id = 'job-1'").fetchone()[0]
+        rows = conn.execute("SELECT COUNT(*) FROM job_logs WHERE job_id = 'job-1'").fetchone()[0]
+    assert inline == "[]"
+    assert rows == 50
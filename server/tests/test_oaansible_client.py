@@ -0,0 +1,129 @@
+"""
+Tests for the oaAnsible client library
+"""
+
+import gc
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from client.oaansible_client import OAAnsibleClient, OAAnsibleClientError, create_sync_client
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a minimal health payload"""
+
+    # Keep-alive, so the client's pooled connection is reused across calls
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"status": "healthy"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sync_client_shared_between_threads(server_url):
+    """One sync client instance can be used from several threads"""
+    results = []
+    errors = []
+
+    with create_sync_client(server_url, api_token=None, timeout=5.0) as client:
+        results.append(client.health_check())
+
+        def worker():
+            try:
+                results.append(client.health_check())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+    assert results == [{"status": "healthy"}] * 3
+
+
+def _mock_client(handler):
+    """Async client whose HTTP layer is served by the given handler"""
+    client = OAAnsibleClient("http://oaansible.test")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+async def test_get_retries_connect_errors():
+    """Connect failures on GET are retried up to RETRY_ATTEMPTS times"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = _mock_client(handler)
+    with pytest.raises(OAAnsibleClientError):
+        await client.health_check()
+    await client.close()
+
+    assert len(calls) == OAAnsibleClient.RETRY_ATTEMPTS
+
+
+async def test_get_does_not_retry_read_timeout():
+    """A read timeout fails straight away instead of multiplying the timeout"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = _mock_client(handler)
+    with pytest.raises(OAAnsibleClientError):
+        await client.health_check()
+    await client.close()
+
+    assert len(calls) == 1
+
+
+def test_unclosed_sync_clients_share_one_loop_thread(server_url):
+    """Throwaway sync clients neither start a thread each nor leak their pool"""
+    for _ in range(10):
+        assert create_sync_client(server_url).health_check() == {"status": "healthy"}
+
+    client = create_sync_client(server_url)
+    client.health_check()
+    inner = client._state["client"]
+    del client
+    gc.collect()
+
+    deadline = time.monotonic() + 2.0
+    while inner._client is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    loop_threads = [t for t in threading.enumerate() if t.name == "oaansible-client"]
+    assert len(loop_threads) == 1
+    assert inner._client is None
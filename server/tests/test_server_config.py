@@ -0,0 +1,20 @@
+"""
+Tests for server configuration
+"""
+
+import pytest
+
+from config.server_config import ServerConfig
+
+
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_max_concurrent_jobs_must_be_positive(monkeypatch, value):
+    """A non-positive job limit is rejected instead of stalling every job"""
+    monkeypatch.setenv("OAANSIBLE_MAX_CONCURRENT_JOBS", value)
+    with pytest.raises(ValueError, match="OAANSIBLE_MAX_CONCURRENT_JOBS"):
+        ServerConfig()
+
+
+def test_max_concurrent_jobs_default(monkeypatch):
+    monkeypatch.delenv("OAANSIBLE_MAX_CONCURRENT_JOBS", raising=False)
+    assert ServerConfig().max_concurrent_jobs == 5
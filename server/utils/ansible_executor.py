@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 import os
+import shutil
 import subprocess
 import tempfile
 import yaml
@@ -17,11 +18,16 @@ from typing import Dict, List, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Resolve CLI paths once so each spawn skips the $PATH walk
+ANSIBLE_CMD = shutil.which("ansible") or "ansible"
+ANSIBLE_PLAYBOOK_CMD = shutil.which("ansible-playbook") or "ansible-playbook"
+
 class AnsibleExecutor:
     """Executes Ansible deployments using the advanced component framework"""
     
-    def __init__(self, ansible_root: Optional[str] = None):
+    def __init__(self, ansible_root: Optional[str] = None, job_manager: Optional[Any] = None):
         self.ansible_root = Path(ansible_root or os.getcwd())
+        self.job_manager = job_manager
         self.playbook_path = self.ansible_root / "playbooks" / "universal.yml"
         self.inventory_dir = self.ansible_root / "inventory"
         self.scripts_dir = self.ansible_root / "scripts"
@@ -81,7 +87,7 @@ class AnsibleExecutor:
         """Initialize the Ansible executor"""
         try:
             # Verify Ansible installation
-            result = await self._run_command(["ansible", "--version"])
+            result = await self._run_command([ANSIBLE_CMD, "--version"])
             if result["returncode"] != 0:
                 raise Exception("Ansible not found or not working")
             
@@ -189,7 +195,7 @@ class AnsibleExecutor:
             
             # Prepare execution command
             cmd = [
-                "ansible-playbook",
+                ANSIBLE_PLAYBOOK_CMD,
                 str(self.playbook_path),
                 "-i", str(inventory_path),
                 "--extra-vars", f"execution_mode=components",
@@ -381,8 +387,17 @@ class AnsibleExecutor:
                 "stderr": str(e)
             }
     
+    def _get_job_manager(self):
+        """Get the job manager for log streaming, creating one on first use"""
+        if self.job_manager is None:
+            # Import here to avoid circular imports
+            from jobs.job_manager import JobManager
+            self.job_manager = JobManager()
+        return self.job_manager
+    
     async def _run_command_with_logging(self, cmd: List[str], job_id: Optional[str] = None) -> Dict[str, Any]:
         """Run command with real-time logging to job manager"""
+        job_manager = self._get_job_manager() if job_id else None
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -399,10 +414,7 @@ class AnsibleExecutor:
                 output_lines.append(line_str)
                 
                 # Log to job if job_id provided
-                if job_id:
-                    # Import here to avoid circular imports
-                    from jobs.job_manager import JobManager
-                    job_manager = JobManager()
+                if job_manager:
                     await job_manager.add_job_log(job_id, line_str)
             
             await process.wait()
@@ -415,9 +427,7 @@ class AnsibleExecutor:
             
         except Exception as e:
             error_msg = str(e)
-            if job_id:
-                from jobs.job_manager import JobManager
-                job_manager = JobManager()
+            if job_manager:
                 await job_manager.add_job_log(job_id, f"ERROR: {error_msg}")
             
             return {